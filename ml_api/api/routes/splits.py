@@ -1,15 +1,19 @@
 """Data split API routes."""
 
+import asyncio
 from uuid import UUID
 from typing import Optional
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, tuple_, bindparam
+from pydantic import TypeAdapter
 
 from ml_api.core.logging import get_logger
 from ml_api.core.exceptions import ResourceNotFoundError
-from ml_api.db.session import get_db
+from ml_api.db.session import get_db, get_db_ro
 from ml_api.db.models.split import DataSplit, SplitStatus
 from ml_api.schemas.split import (
     DataSplitCreate,
@@ -21,15 +25,28 @@ from ml_api.services.split_service import SplitService
 from ml_api.clients import get_gcs_client
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Built once at import so every request reuses the same compiled-statement
+# cache entry instead of constructing a fresh select() per call
+_SPLIT_BY_ID = select(DataSplit).where(DataSplit.id == bindparam("split_id"))
+
+# Response field names, resolved once for the no-validation list path
+_SPLIT_RESPONSE_FIELDS = tuple(DataSplitResponse.model_fields)
+
+# One adapter for the whole list envelope: dump_python(mode="json") serializes
+# every item in a single C-level pass instead of a per-model model_dump loop
+_SPLIT_LIST_ADAPTER = TypeAdapter(DataSplitListResponse)
+
+# Strong references to in-flight background cleanup tasks so they aren't
+# garbage-collected mid-run
+_artifact_cleanup_tasks: set = set()
 
 
 def get_split_service(
     db: AsyncSession = Depends(get_db),
 ) -> SplitService:
     """Get split service dependency."""
-    from ml_api.services.split_service import SplitService
-
     return SplitService(db, get_gcs_client())
 
 
@@ -59,12 +76,12 @@ async def create_split(
 @router.get("/splits/{split_id}", response_model=DataSplitResponse)
 async def get_split(
     split_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_ro),
 ):
     """Get data split by ID."""
     logger.info("get_split_request", split_id=str(split_id))
 
-    result = await db.execute(select(DataSplit).where(DataSplit.id == split_id))
+    result = await db.execute(_SPLIT_BY_ID, {"split_id": split_id})
     split = result.scalar_one_or_none()
 
     if not split:
@@ -73,52 +90,77 @@ async def get_split(
     return split
 
 
-@router.get("/splits", response_model=DataSplitListResponse)
+@router.get("/splits", response_model=None)
 async def list_splits(
     entity_id: Optional[str] = Query(None, description="Filter by entity ID"),
     status: Optional[SplitStatus] = Query(None, description="Filter by status"),
-    page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Page size"),
-    db: AsyncSession = Depends(get_db),
+    cursor_created_at: Optional[datetime] = Query(
+        None, description="Keyset cursor: created_at of the last row on the previous page"
+    ),
+    cursor_id: Optional[UUID] = Query(
+        None, description="Keyset cursor: id of the last row on the previous page"
+    ),
+    db: AsyncSession = Depends(get_db_ro),
 ):
-    """List data splits with filtering and pagination."""
+    """List data splits with filtering and keyset pagination.
+
+    Page through results by passing back the next_cursor_* values from the
+    previous response. Keyset pagination stays O(page_size) at any depth,
+    where OFFSET forces Postgres to scan and discard all skipped rows.
+    """
     logger.info(
         "list_splits_request",
         entity_id=entity_id,
         status=status,
-        page=page,
         page_size=page_size,
+        cursor_created_at=cursor_created_at,
+        cursor_id=cursor_id,
     )
 
-    # Build query
     query = select(DataSplit)
 
     if entity_id:
         query = query.where(DataSplit.entity_id == entity_id)
     if status:
         query = query.where(DataSplit.status == status)
+    if cursor_created_at is not None and cursor_id is not None:
+        # Row-value comparison matches the (created_at DESC, id DESC) sort,
+        # so Postgres seeks straight to the cursor position in the index
+        query = query.where(
+            tuple_(DataSplit.created_at, DataSplit.id) < (cursor_created_at, cursor_id)
+        )
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    # Fetch one extra row to know whether another page exists
+    query = query.order_by(DataSplit.created_at.desc(), DataSplit.id.desc())
+    query = query.limit(page_size + 1)
 
-    # Paginate
-    query = query.order_by(DataSplit.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
-
-    # Execute
     result = await db.execute(query)
-    splits = result.scalars().all()
-
-    logger.info("list_splits_completed", count=len(splits), total=total)
-
-    return DataSplitListResponse(
-        items=splits,
-        total=total,
-        page=page,
+    splits = list(result.scalars().all())
+
+    has_more = len(splits) > page_size
+    splits = splits[:page_size]
+
+    logger.info("list_splits_completed", count=len(splits), has_more=has_more)
+
+    # Rows come straight from the DB, so skip Pydantic's per-field validation:
+    # model_construct builds the response objects directly and the router's
+    # ORJSONResponse serializes them without FastAPI's response_model pass
+    items = [
+        DataSplitResponse.model_construct(
+            **{field: getattr(split, field) for field in _SPLIT_RESPONSE_FIELDS}
+        )
+        for split in splits
+    ]
+
+    last = splits[-1] if has_more else None
+    response = DataSplitListResponse.model_construct(
+        items=items,
         page_size=page_size,
+        next_cursor_created_at=last.created_at if last else None,
+        next_cursor_id=last.id if last else None,
     )
+    return ORJSONResponse(content=_SPLIT_LIST_ADAPTER.dump_python(response, mode="json"))
 
 
 @router.patch("/splits/{split_id}", response_model=DataSplitResponse)
@@ -130,18 +172,30 @@ async def update_split(
     """Update data split metadata (safe operations only)."""
     logger.info("update_split_request", split_id=str(split_id))
 
-    result = await db.execute(select(DataSplit).where(DataSplit.id == split_id))
-    split = result.scalar_one_or_none()
-
-    if not split:
-        raise ResourceNotFoundError("DataSplit", str(split_id))
-
     # Only allow updating split_params for now
     if request.split_params is not None:
-        split.split_params = request.split_params
-
-    await db.commit()
-    await db.refresh(split)
+        # Single UPDATE ... RETURNING round trip instead of SELECT + UPDATE
+        # + post-commit refresh
+        stmt = (
+            update(DataSplit)
+            .where(DataSplit.id == split_id)
+            .values(split_params=request.split_params)
+            .returning(DataSplit)
+        )
+        result = await db.execute(stmt)
+        split = result.scalar_one_or_none()
+
+        if not split:
+            raise ResourceNotFoundError("DataSplit", str(split_id))
+
+        await db.commit()
+    else:
+        # Nothing to change; just fetch
+        result = await db.execute(_SPLIT_BY_ID, {"split_id": split_id})
+        split = result.scalar_one_or_none()
+
+        if not split:
+            raise ResourceNotFoundError("DataSplit", str(split_id))
 
     logger.info("update_split_completed", split_id=str(split_id))
     return split
@@ -164,26 +218,44 @@ async def delete_split(
         delete_artifacts=delete_artifacts,
     )
 
-    result = await db.execute(select(DataSplit).where(DataSplit.id == split_id))
-    split = result.scalar_one_or_none()
+    # Soft delete in a single UPDATE ... RETURNING round trip, fetching the
+    # artifact URIs needed for cleanup at the same time
+    stmt = (
+        update(DataSplit)
+        .where(DataSplit.id == split_id)
+        .values(status=SplitStatus.FAILED)
+        .returning(DataSplit.train_uri, DataSplit.val_uri, DataSplit.test_uri)
+    )
+    result = await db.execute(stmt)
+    row = result.one_or_none()
 
-    if not split:
+    if row is None:
         raise ResourceNotFoundError("DataSplit", str(split_id))
 
-    # Soft delete - mark as failed/deleted
-    split.status = SplitStatus.FAILED
+    await db.commit()
 
     if delete_artifacts:
-        # Delete GCS artifacts (implement in service)
-        gcs_client = get_gcs_client()
-        for uri in [split.train_uri, split.val_uri, split.test_uri]:
-            if uri and uri.startswith("gs://"):
-                blob_path = uri.replace(f"gs://{gcs_client.bucket_name}/", "")
-                try:
-                    gcs_client.delete(blob_path)
-                except Exception as e:
-                    logger.warning("failed_to_delete_artifact", uri=uri, error=str(e))
-
-    await db.commit()
+        # Delete GCS artifacts in the background; each delete is a blocking
+        # HTTPS round-trip, so the 204 returns without waiting on them
+        task = asyncio.create_task(_delete_split_artifacts(row))
+        _artifact_cleanup_tasks.add(task)
+        task.add_done_callback(_artifact_cleanup_tasks.discard)
 
     logger.info("delete_split_completed", split_id=str(split_id))
+
+
+async def _delete_split_artifacts(row) -> None:
+    """Delete a split's train/val/test artifacts from GCS concurrently."""
+    gcs_client = get_gcs_client()
+    blob_paths = [
+        uri.replace(f"gs://{gcs_client.bucket_name}/", "")
+        for uri in (row.train_uri, row.val_uri, row.test_uri)
+        if uri and uri.startswith("gs://")
+    ]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(gcs_client.delete, blob_path) for blob_path in blob_paths),
+        return_exceptions=True,
+    )
+    for blob_path, outcome in zip(blob_paths, results):
+        if isinstance(outcome, Exception):
+            logger.warning("failed_to_delete_artifact", blob_path=blob_path, error=str(outcome))
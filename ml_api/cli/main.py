@@ -1,5 +1,7 @@
 """Typer CLI application for ML API."""
 
+import os
+
 import typer
 from typing import Optional
 import uvicorn
@@ -54,16 +56,27 @@ def serve(
 
         ml-api serve --ssl-keyfile key.pem --ssl-certfile cert.pem
     """
+    from ml_api.core.config import settings
+
+    # Use every core in production when the user left the default
+    if workers == 1 and not reload and settings.is_production:
+        workers = os.cpu_count() or 1
+
     typer.echo(f"Starting ML API server on {host}:{port} with {workers} worker(s)...")
 
     uvicorn_config = {
-        "app": "app.main:app",
+        "app": "ml_api.main:app",
         "host": host,
         "port": port,
         "log_level": log_level.lower(),
         "access_log": access_log,
         "proxy_headers": proxy_headers,
         "timeout_keep_alive": timeout_keep_alive,
+        # Request uvloop + httptools explicitly instead of relying on
+        # uvicorn's auto-detection; both ship with uvicorn[standard]
+        "loop": "uvloop",
+        "http": "httptools",
+        "interface": "asgi3",
     }
 
     # Add optional parameters only if provided
@@ -96,6 +109,17 @@ def serve(
     uvicorn.run(**uvicorn_config)
 
 
+@app.command(name="init-db")
+def init_db():
+    """Create database tables (local dev; deployments run migrations)."""
+    import asyncio
+
+    from ml_api.db.session import init_db as _init_db
+
+    asyncio.run(_init_db())
+    typer.echo("Database initialized.")
+
+
 @app.command()
 def version():
     """Show version information."""
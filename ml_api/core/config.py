@@ -1,5 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
+from functools import cached_property
 from typing import Literal
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -8,8 +9,14 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    # frozen: settings are read-only after startup, which lets Pydantic skip
+    # mutation bookkeeping and makes cached_property safe to memoize
     model_config = SettingsConfigDict(
-        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, extra="ignore"
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
     )
 
     # Application
@@ -29,8 +36,10 @@ class Settings(BaseSettings):
         default="postgresql+asyncpg://localhost:5432/mlapi",
         description="PostgreSQL connection string",
     )
-    database_pool_size: int = 10
-    database_max_overflow: int = 20
+    # Size so pool_size + max_overflow covers peak concurrent DB-touching
+    # requests per worker, or requests stall waiting on the pool
+    database_pool_size: int = 20
+    database_max_overflow: int = 40
 
     # Google Cloud Storage
     gcs_bucket: str = Field(default="", description="GCS bucket for artifacts")
@@ -38,6 +47,15 @@ class Settings(BaseSettings):
     google_application_credentials: str = Field(
         default="", description="Path to GCP service account key"
     )
+    gcs_multipart_threshold_mb: int = Field(
+        default=150, description="File size above which GCS transfers use parallel chunks"
+    )
+    gcs_multipart_chunksize_mb: int = Field(
+        default=32, description="Chunk size for parallel GCS transfers"
+    )
+    gcs_max_concurrency: int = Field(
+        default=10, description="Maximum worker count for parallel GCS transfers"
+    )
 
     # Redis (for Arq background jobs)
     redis_url: str = "redis://localhost:6379/0"
@@ -52,6 +70,13 @@ class Settings(BaseSettings):
     default_model_type: Literal["catboost", "xgboost", "lightgbm"] = "catboost"
     default_classification_metric: str = "auc"
     default_regression_metric: str = "rmse"
+    use_gpu: bool = Field(default=False, description="Train GBDT models on GPU when available")
+    trainer_num_threads: int = Field(
+        default=0, description="Trainer thread count (0 = one per physical core)"
+    )
+    gpu_min_rows: int = Field(
+        default=100_000, description="Minimum training rows before the GPU path is worth it"
+    )
 
     # Optuna defaults
     default_optuna_n_trials: int = 50
@@ -78,17 +103,17 @@ class Settings(BaseSettings):
         """Parse comma-separated origins into list."""
         return [origin.strip() for origin in v.split(",") if origin.strip()]
 
-    @property
+    @cached_property
     def max_upload_size_bytes(self) -> int:
-        """Convert MB to bytes."""
+        """Convert MB to bytes (computed once)."""
         return self.max_upload_size_mb * 1024 * 1024
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.environment == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.environment == "production"
@@ -2,7 +2,8 @@
 
 from typing import Any
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -132,9 +133,11 @@ def create_error_response(
     }
 
 
-async def mlapi_exception_handler(request: Request, exc: MLAPIException) -> JSONResponse:
+async def mlapi_exception_handler(request: Request, exc: MLAPIException) -> ORJSONResponse:
     """Handle MLAPIException errors."""
-    request_id = getattr(request.state, "request_id", "unknown")
+    # Set unconditionally by ObservabilityMiddleware; direct access skips
+    # the getattr-with-default slow path on every error response
+    request_id = request.state.request_id
 
     log_exception(
         logger,
@@ -144,7 +147,8 @@ async def mlapi_exception_handler(request: Request, exc: MLAPIException) -> JSON
         status_code=exc.status_code,
     )
 
-    return JSONResponse(
+    # orjson serializes in one C pass; JSONResponse re-encodes via stdlib
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=create_error_response(
             request_id=request_id,
@@ -158,9 +162,11 @@ async def mlapi_exception_handler(request: Request, exc: MLAPIException) -> JSON
 
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Handle Pydantic validation errors."""
-    request_id = getattr(request.state, "request_id", "unknown")
+    # Set unconditionally by ObservabilityMiddleware; direct access skips
+    # the getattr-with-default slow path on every error response
+    request_id = request.state.request_id
 
     logger.warning(
         "validation_error",
@@ -168,21 +174,23 @@ async def validation_exception_handler(
         body=str(exc.body) if hasattr(exc, "body") else None,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=create_error_response(
             request_id=request_id,
             code="validation_error",
             message="Request validation failed",
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            details={"errors": exc.errors()},
+            details={"errors": jsonable_encoder(exc.errors())},
         ),
     )
 
 
-async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions."""
-    request_id = getattr(request.state, "request_id", "unknown")
+    # Set unconditionally by ObservabilityMiddleware; direct access skips
+    # the getattr-with-default slow path on every error response
+    request_id = request.state.request_id
 
     logger.warning(
         "http_exception",
@@ -190,7 +198,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
         detail=exc.detail,
     )
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=create_error_response(
             request_id=request_id,
@@ -201,13 +209,15 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions."""
-    request_id = getattr(request.state, "request_id", "unknown")
+    # Set unconditionally by ObservabilityMiddleware; direct access skips
+    # the getattr-with-default slow path on every error response
+    request_id = request.state.request_id
 
     log_exception(logger, exc, context="unexpected_exception")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=create_error_response(
             request_id=request_id,
@@ -0,0 +1,25 @@
+"""Time-ordered identifier generation."""
+
+import os
+import time
+from uuid import UUID
+
+
+def uuid7() -> UUID:
+    """Generate a UUIDv7 (RFC 9562): time-ordered, wire-compatible with UUIDv4.
+
+    Random UUIDs scatter B-tree inserts across the whole primary-key index,
+    forcing page splits; UUIDv7 leads with a 48-bit Unix-millisecond
+    timestamp so inserts stay append-only. Remove in favor of uuid.uuid7()
+    once the project moves to a Python version that ships it.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ms & 0xFFFF_FFFF_FFFF) << 80  # unix_ts_ms
+        | 0x7 << 76  # version
+        | (rand >> 68 & 0x0FFF) << 64  # rand_a
+        | 0b10 << 62  # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    )
+    return UUID(int=value)
@@ -1,14 +1,15 @@
 """Telemetry and metrics collection."""
 
+import uuid
 from typing import Callable
 from functools import wraps
 import time
 
+import structlog
 from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 
 from ml_api.core.config import settings
+from ml_api.core.logging import get_logger, set_request_id, flush_logs
 
 # Create registry
 registry = CollectorRegistry()
@@ -103,37 +104,129 @@ data_rows_processed = Histogram(
 )
 
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect HTTP metrics."""
-
-    async def dispatch(self, request: Request, call_next):
-        """Collect metrics for HTTP requests."""
-        if not settings.enable_metrics:
-            return await call_next(request)
-
-        # Skip metrics endpoint itself
-        if request.url.path == "/metrics":
-            return await call_next(request)
-
-        start_time = time.time()
-
-        response = await call_next(request)
-
-        duration = time.time() - start_time
+# Label handles cached per (method, endpoint[, status]) so the request hot
+# path skips prometheus_client's labels() dict lookup and child construction
+_request_counter_cache: dict = {}
+_request_histogram_cache: dict = {}
+
+
+def _request_counter(method: str, endpoint: str, status: int):
+    """Get a cached labelled child of http_requests_total."""
+    key = (method, endpoint, status)
+    child = _request_counter_cache.get(key)
+    if child is None:
+        child = _request_counter_cache.setdefault(
+            key, http_requests_total.labels(method=method, endpoint=endpoint, status=status)
+        )
+    return child
+
+
+def _request_histogram(method: str, endpoint: str):
+    """Get a cached labelled child of http_request_duration_seconds."""
+    key = (method, endpoint)
+    child = _request_histogram_cache.get(key)
+    if child is None:
+        child = _request_histogram_cache.setdefault(
+            key, http_request_duration_seconds.labels(method=method, endpoint=endpoint)
+        )
+    return child
+
+
+# Infrastructure endpoints scraped/probed on a tight interval; logging and
+# metrics for these are pure noise, so the middleware passes them through
+_BYPASS_PATHS = frozenset({"/metrics", "/healthz", "/readyz"})
+
+
+class ObservabilityMiddleware:
+    """Single ASGI middleware handling request IDs, request logging, and HTTP metrics.
+
+    Implemented as a raw ASGI callable rather than BaseHTTPMiddleware, which
+    spawns an anyio task group and proxies the response through a memory
+    stream for every request.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Process request: correlate, log, and record metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["path"] in _BYPASS_PATHS:
+            # Exception handlers read request.state.request_id directly, so
+            # even bypassed probes get a (static) ID without the uuid cost
+            scope.setdefault("state", {})["request_id"] = "probe"
+            await self.app(scope, receive, send)
+            return
+
+        # Get or generate request ID
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+        if request_id is None:
+            request_id = str(uuid.uuid4())
+
+        set_request_id(request_id)
+
+        # Add to request state (backs request.state.request_id) for easy access
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        # Bind once so merge_contextvars injects it into every event for free
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+
+        logger = get_logger(__name__)
+        logger.info(
+            "request_started",
+            method=method,
+            path=path,
+            client_host=client[0] if client else None,
+        )
+
+        status_code = 500
+        request_id_header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), request_id_header]
+            await send(message)
+
+        start_time = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+
+            # Record metrics, labelled by the route template (e.g.
+            # /v1/splits/{split_id}) rather than the raw path so UUIDs don't
+            # blow up metric cardinality
+            route = scope.get("route")
+            endpoint = route.path if route is not None else path
+            if settings.enable_metrics:
+                _request_counter(method, endpoint, status_code).inc()
+                _request_histogram(method, endpoint).observe(duration)
 
-        # Record metrics
-        http_requests_total.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code,
-        ).inc()
+            logger.info(
+                "request_completed",
+                method=method,
+                path=path,
+                status_code=status_code,
+            )
 
-        http_request_duration_seconds.labels(
-            method=request.method,
-            endpoint=request.url.path,
-        ).observe(duration)
+            # Make sure error context is visible immediately despite buffering
+            if status_code >= 500:
+                flush_logs()
 
-        return response
+            structlog.contextvars.unbind_contextvars("request_id")
 
 
 def track_prediction(model_type: str, task_type: str):
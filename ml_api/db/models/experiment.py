@@ -5,9 +5,9 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import String, Text, Enum, ForeignKey, Index, JSON
+from sqlalchemy import String, Text, Enum, ForeignKey, Index, DateTime, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from ml_api.db.base import Base
 
@@ -71,27 +71,35 @@ class Experiment(Base):
     # Configuration
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     target_column: Mapped[str] = mapped_column(String(255), nullable=False)
-    feature_columns: Mapped[list] = mapped_column(JSON, nullable=False)
+    feature_columns: Mapped[list] = mapped_column(JSONB, nullable=False)
 
     # Model configuration
     task_type: Mapped[TaskType] = mapped_column(
-        Enum(TaskType, name="task_type_enum"),
+        Enum(TaskType, name="task_type_enum", native_enum=False, length=32, create_constraint=True),
         nullable=False,
     )
     model_type: Mapped[ModelType] = mapped_column(
-        Enum(ModelType, name="model_type_enum"),
+        Enum(
+            ModelType, name="model_type_enum", native_enum=False, length=32, create_constraint=True
+        ),
         nullable=False,
         default=ModelType.CATBOOST,
     )
 
     # Optuna configuration
-    optuna_config: Mapped[dict] = mapped_column(JSON, nullable=False)
-    search_space: Mapped[dict] = mapped_column(JSON, nullable=True)
+    optuna_config: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    search_space: Mapped[dict] = mapped_column(JSONB, nullable=True)
     metric_name: Mapped[str] = mapped_column(String(100), nullable=False)
 
     # Results
     status: Mapped[ExperimentStatus] = mapped_column(
-        Enum(ExperimentStatus, name="experiment_status_enum"),
+        Enum(
+            ExperimentStatus,
+            name="experiment_status_enum",
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+        ),
         nullable=False,
         default=ExperimentStatus.PENDING,
         index=True,
@@ -102,10 +110,14 @@ class Experiment(Base):
     # Timestamps
     started_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     finished_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    # created/updated computed by Postgres; no Python utcnow() per row
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -132,6 +144,12 @@ class Experiment(Base):
     __table_args__ = (
         Index("ix_experiments_split_id_created_at", "split_id", "created_at"),
         Index("ix_experiments_model_type_task_type", "model_type", "task_type"),
+        # Partial index keeps active-experiment dashboards off the full table
+        Index(
+            "ix_experiments_running",
+            "updated_at",
+            postgresql_where=text("status = 'RUNNING'"),
+        ),
     )
 
     def __repr__(self) -> str:
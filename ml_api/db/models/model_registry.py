@@ -5,9 +5,9 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Integer, Text, Enum, ForeignKey, Index, JSON
+from sqlalchemy import Integer, Text, Enum, ForeignKey, Index, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from ml_api.db.base import Base
 
@@ -47,7 +47,13 @@ class ModelRegistry(Base):
     # Version info
     version: Mapped[int] = mapped_column(Integer, nullable=False)
     stage: Mapped[ModelStage] = mapped_column(
-        Enum(ModelStage, name="model_stage_enum"),
+        Enum(
+            ModelStage,
+            name="model_stage_enum",
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+        ),
         nullable=False,
         default=ModelStage.STAGING,
         index=True,
@@ -57,16 +63,19 @@ class ModelRegistry(Base):
     artifact_uri: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Model metadata
-    signature: Mapped[dict] = mapped_column(JSON, nullable=False)
-    preprocess_config: Mapped[dict] = mapped_column(JSON, nullable=True)
-    postprocess_config: Mapped[dict] = mapped_column(JSON, nullable=True)
-    metrics: Mapped[dict] = mapped_column(JSON, nullable=True)
-
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    signature: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    preprocess_config: Mapped[dict] = mapped_column(JSONB, nullable=True)
+    postprocess_config: Mapped[dict] = mapped_column(JSONB, nullable=True)
+    metrics: Mapped[dict] = mapped_column(JSONB, nullable=True)
+
+    # Timestamps (computed by Postgres; no Python utcnow() per row)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -5,10 +5,11 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Integer, Text, Enum, Index, JSON
+from sqlalchemy import String, Integer, Text, Enum, Index, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 
+from ml_api.core.ids import uuid7
 from ml_api.db.base import Base
 
 if TYPE_CHECKING:
@@ -40,7 +41,7 @@ class DataSplit(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         index=True,
     )
 
@@ -52,10 +53,16 @@ class DataSplit(Base):
 
     # Split configuration
     split_strategy: Mapped[SplitStrategy] = mapped_column(
-        Enum(SplitStrategy, name="split_strategy_enum"),
+        Enum(
+            SplitStrategy,
+            name="split_strategy_enum",
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+        ),
         nullable=False,
     )
-    split_params: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    split_params: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
 
     # Split artifacts (GCS URIs)
     train_uri: Mapped[str] = mapped_column(Text, nullable=True)
@@ -66,20 +73,29 @@ class DataSplit(Base):
     row_count_train: Mapped[int] = mapped_column(Integer, nullable=True)
     row_count_val: Mapped[int] = mapped_column(Integer, nullable=True)
     row_count_test: Mapped[int] = mapped_column(Integer, nullable=True)
-    schema_json: Mapped[dict] = mapped_column(JSON, nullable=True)
+    schema_json: Mapped[dict] = mapped_column(JSONB, nullable=True)
 
     # Status
     status: Mapped[SplitStatus] = mapped_column(
-        Enum(SplitStatus, name="split_status_enum"),
+        Enum(
+            SplitStatus,
+            name="split_status_enum",
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+        ),
         nullable=False,
         default=SplitStatus.PENDING,
     )
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow, nullable=False)
+    # Timestamps (computed by Postgres; no Python utcnow() per row)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     updated_at: Mapped[datetime] = mapped_column(
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
@@ -5,9 +5,9 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Integer, Text, Enum, ForeignKey, Index, JSON
+from sqlalchemy import Integer, Text, Enum, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 
 from ml_api.db.base import Base
 
@@ -47,15 +47,21 @@ class Trial(Base):
 
     # Trial info
     number: Mapped[int] = mapped_column(Integer, nullable=False)
-    params: Mapped[dict] = mapped_column(JSON, nullable=False)
-    metrics: Mapped[dict] = mapped_column(JSON, nullable=True)
+    params: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    metrics: Mapped[dict] = mapped_column(JSONB, nullable=True)
 
     # Artifacts
     artifact_uri: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Status
     status: Mapped[TrialStatus] = mapped_column(
-        Enum(TrialStatus, name="trial_status_enum"),
+        Enum(
+            TrialStatus,
+            name="trial_status_enum",
+            native_enum=False,
+            length=32,
+            create_constraint=True,
+        ),
         nullable=False,
         default=TrialStatus.RUNNING,
     )
@@ -75,6 +81,17 @@ class Trial(Base):
     # Indexes
     __table_args__ = (
         Index("ix_trials_experiment_id_number", "experiment_id", "number", unique=True),
+        # GIN indexes make containment/key queries over trial history indexable
+        Index("ix_trials_params_gin", "params", postgresql_using="gin"),
+        Index("ix_trials_metrics_gin", "metrics", postgresql_using="gin"),
+        # Covering partial index: summarizing an experiment's completed
+        # trials becomes an index-only scan (no heap reads for metrics)
+        Index(
+            "ix_trials_experiment_completed",
+            "experiment_id",
+            postgresql_where=text("status = 'COMPLETED'"),
+            postgresql_include=["number", "metrics"],
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1,6 +1,8 @@
 """Database session management."""
 
 from typing import AsyncGenerator
+
+import orjson
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
@@ -9,6 +11,12 @@ from ml_api.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+
+def _json_serializer(value) -> str:
+    """orjson for JSONB binds: C-level encode instead of stdlib json."""
+    return orjson.dumps(value).decode("utf-8")
+
+
 # Create async engine
 if settings.is_development:
     # Use NullPool for development (no pooling)
@@ -16,6 +24,8 @@ if settings.is_development:
         settings.database_url,
         echo=settings.debug,
         poolclass=NullPool,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 else:
     # Use default pool with configuration for production
@@ -24,6 +34,20 @@ else:
         echo=settings.debug,
         pool_size=settings.database_pool_size,
         max_overflow=settings.database_max_overflow,
+        # Validate pooled connections before handing them out and recycle
+        # before typical idle-timeout windows: stale sockets otherwise show
+        # up as first-use latency spikes or errors after quiet periods
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        pool_timeout=10,
+        query_cache_size=1200,
+        # asyncpg prepares statements lazily; a larger cache keeps the hot
+        # endpoint queries prepared across requests (fewer round trips)
+        connect_args={"statement_cache_size": 512},
+        # Every Trial.params/metrics row hydrated or inserted runs through
+        # these; orjson replaces the stdlib tokenizer
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
     )
 
 # Create session factory
@@ -37,7 +61,7 @@ AsyncSessionLocal = async_sessionmaker(
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get database session."""
+    """Dependency to get database session (commits on success)."""
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -49,6 +73,16 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_db_ro() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get database session for read-only routes.
+
+    Skips the trailing commit that get_db issues: for SELECT-only requests
+    that commit is an extra round trip (and a WAL flush) per call.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
 async def init_db() -> None:
     """Initialize database (create tables)."""
     from ml_api.db.base import Base
@@ -4,11 +4,12 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from ml_api.core.config import settings
-from ml_api.core.logging import configure_logging, get_logger, RequestIDMiddleware
+from ml_api.core.logging import configure_logging, get_logger
 from ml_api.core.exceptions import (
     MLAPIException,
     mlapi_exception_handler,
@@ -16,8 +17,10 @@ from ml_api.core.exceptions import (
     http_exception_handler,
     general_exception_handler,
 )
-from ml_api.core.telemetry import MetricsMiddleware, get_metrics
-from ml_api.db.session import init_db, close_db
+from ml_api.core.telemetry import ObservabilityMiddleware, get_metrics
+from ml_api.db.session import engine, close_db
+from ml_api.schemas import warm_up_schemas
+from sqlalchemy import text
 
 # Import routes
 from ml_api.api.routes import splits, health
@@ -35,8 +38,16 @@ async def lifespan(app: FastAPI):
     logger.info("application_starting", environment=settings.environment)
     configure_logging()
 
+    # Compile schema validators before traffic arrives instead of on the
+    # first request that touches each model
+    warm_up_schemas()
+
+    # Schema management happens out-of-band (alembic / `ml-api init-db`);
+    # running create_all per worker added reflection queries and DDL lock
+    # races to every boot. Startup only verifies the database is reachable.
     if not settings.is_development:
-        await init_db()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
 
     logger.info("application_started")
 
@@ -53,14 +64,17 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Production-grade ML API with Polars, FastAPI, and GCS",
+    # orjson encodes every response in one C pass; the stdlib default is the
+    # bottleneck on large prediction/importance payloads
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
-# Add middleware
-app.add_middleware(RequestIDMiddleware)
-
-if settings.enable_metrics:
-    app.add_middleware(MetricsMiddleware)
+# Add middleware (request IDs, logging, and metrics in a single dispatch).
+# Starlette wraps later-added middleware outermost, so keep CORS added after
+# this: preflights then short-circuit at the edge and never show up in the
+# handler latency metrics.
+app.add_middleware(ObservabilityMiddleware)
 
 if settings.cors_enabled:
     app.add_middleware(
@@ -99,7 +113,7 @@ if __name__ == "__main__":
     import uvicorn
 
     uvicorn.run(
-        "app.main:app",
+        "ml_api.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.is_development,
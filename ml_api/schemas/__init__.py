@@ -1 +1,21 @@
 """Pydantic schemas for request/response validation."""
+
+
+def warm_up_schemas() -> None:
+    """Eagerly build validators and JSON schemas for every schema model.
+
+    Pydantic v2 compiles validators and caches JSON schemas lazily on first
+    use, so without this the first request after a cold start pays that
+    one-time cost. Called from application startup.
+    """
+    import inspect
+
+    from pydantic import BaseModel
+
+    from ml_api.schemas import experiment, importance, model_registry, predict, split
+
+    for module in (experiment, importance, model_registry, predict, split):
+        for _, model in inspect.getmembers(module, inspect.isclass):
+            if issubclass(model, BaseModel) and model is not BaseModel:
+                model.model_rebuild(force=True)
+                model.model_json_schema()
@@ -3,7 +3,7 @@
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from ml_api.db.models.model_registry import ModelStage
 
@@ -16,8 +16,12 @@ class ImportanceRequest(BaseModel):
     experiment_id: Optional[UUID] = Field(None, description="Experiment ID (uses best model)")
     stage: Optional[ModelStage] = Field(None, description="Model stage (production/staging)")
 
-    # Optional data for SHAP
+    # Optional data for SHAP: row dicts, an Arrow IPC stream (columnar,
+    # loaded zero-copy instead of dict-per-row), or a dataset URI
     instances: Optional[list[dict]] = Field(None, description="Instances for SHAP explanation")
+    arrow_ipc: Optional[bytes] = Field(
+        None, description="SHAP instances as an Arrow IPC stream (base64 in JSON)"
+    )
     dataset_uri: Optional[str] = Field(None, description="Dataset URI for SHAP background")
 
     # Configuration
@@ -27,7 +31,22 @@ class ImportanceRequest(BaseModel):
         description="Preference order for importance methods",
     )
 
-    model_config = ConfigDict(use_enum_values=True)
+    # extra="forbid" keeps validation from collecting unknown keys per
+    # instance row on large batch payloads; bytes travel base64-encoded in
+    # JSON (Pydantic's default is raw utf-8, which mangles Arrow IPC)
+    model_config = ConfigDict(
+        use_enum_values=True,
+        extra="forbid",
+        val_json_bytes="base64",
+        ser_json_bytes="base64",
+    )
+
+    @model_validator(mode="after")
+    def check_input_data(self) -> "ImportanceRequest":
+        """Allow at most one way of supplying SHAP instances."""
+        if self.instances is not None and self.arrow_ipc is not None:
+            raise ValueError("Provide at most one of 'instances' or 'arrow_ipc'")
+        return self
 
 
 class FeatureImportance(BaseModel):
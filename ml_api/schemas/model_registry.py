@@ -24,7 +24,7 @@ class ModelRegistryResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True, frozen=True)
 
 
 class ModelRegistryListResponse(BaseModel):
@@ -35,7 +35,7 @@ class ModelRegistryListResponse(BaseModel):
     page: int
     page_size: int
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ModelPromoteRequest(BaseModel):
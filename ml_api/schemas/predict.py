@@ -3,7 +3,7 @@
 from typing import Optional, Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, model_validator
 
 from ml_api.db.models.model_registry import ModelStage
 
@@ -16,14 +16,33 @@ class PredictRequest(BaseModel):
     experiment_id: Optional[UUID] = Field(None, description="Experiment ID (uses best model)")
     stage: Optional[ModelStage] = Field(None, description="Model stage (production/staging)")
 
-    # Input data
-    instances: list[dict] = Field(..., description="Input instances", min_length=1)
+    # Input data: row dicts for small payloads, or an Arrow IPC stream for
+    # large batches (columnar, loaded zero-copy instead of dict-per-row)
+    instances: Optional[list[dict]] = Field(None, description="Input instances", min_length=1)
+    arrow_ipc: Optional[bytes] = Field(
+        None, description="Input instances as an Arrow IPC stream (base64 in JSON)"
+    )
 
     # Optional overrides
     preprocess_config: Optional[dict] = Field(None, description="Override preprocessing config")
     postprocess_config: Optional[dict] = Field(None, description="Override postprocessing config")
 
-    model_config = ConfigDict(use_enum_values=True)
+    # extra="forbid" keeps validation from collecting unknown keys per
+    # instance row on large batch payloads; bytes travel base64-encoded in
+    # JSON (Pydantic's default is raw utf-8, which mangles Arrow IPC)
+    model_config = ConfigDict(
+        use_enum_values=True,
+        extra="forbid",
+        val_json_bytes="base64",
+        ser_json_bytes="base64",
+    )
+
+    @model_validator(mode="after")
+    def check_input_data(self) -> "PredictRequest":
+        """Require exactly one of instances or arrow_ipc."""
+        if (self.instances is None) == (self.arrow_ipc is None):
+            raise ValueError("Provide exactly one of 'instances' or 'arrow_ipc'")
+        return self
 
 
 class PredictResponse(BaseModel):
@@ -53,15 +53,21 @@ class DataSplitResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+    # Responses are never mutated after construction; frozen models skip the
+    # per-field setattr machinery and are hashable
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True, frozen=True)
 
 
 class DataSplitListResponse(BaseModel):
-    """Schema for data split list response."""
+    """Schema for data split list response (keyset-paginated)."""
 
     items: list[DataSplitResponse]
-    total: int
-    page: int
     page_size: int
+    next_cursor_created_at: Optional[datetime] = Field(
+        None, description="Pass as cursor_created_at to fetch the next page"
+    )
+    next_cursor_id: Optional[UUID] = Field(
+        None, description="Pass as cursor_id to fetch the next page"
+    )
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -1,6 +1,9 @@
 """Model artifact I/O to/from GCS."""
 
+import os
 import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Tuple
 from uuid import UUID
@@ -11,6 +14,26 @@ from ml_api.clients import GCSClient
 
 logger = get_logger(__name__)
 
+# tmpfs keeps the path-based fallback in RAM instead of writing and re-reading
+# every trial's model binary through the disk and page cache
+_TMPFS_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _save_model_to_gcs(
+    trainer: Any, model: Any, blob_path: str, model_type: str, gcs_client: GCSClient
+) -> None:
+    """Upload a model binary, streaming from memory when the trainer supports it."""
+    raw = trainer.save_model_to_buffer(model)
+    if raw is not None:
+        gcs_client.upload_bytes(blob_path, raw)
+        return
+    with tempfile.NamedTemporaryFile(
+        suffix=get_model_extension(model_type), dir=_TMPFS_DIR, delete=False
+    ) as tmp:
+        trainer.save_model(model, tmp.name)
+        gcs_client.upload_file(blob_path, tmp.name)
+        Path(tmp.name).unlink()
+
 
 def save_model_artifacts(
     model: Any,
@@ -39,46 +62,40 @@ def save_model_artifacts(
 
     try:
         base_path = f"models/{experiment_id}/v{version}"
+        ext = get_model_extension(model_type)
 
-        # Save model binary
-        with tempfile.NamedTemporaryFile(
-            suffix=get_model_extension(model_type), delete=False
-        ) as tmp:
-            trainer.save_model(model, tmp.name)
-            gcs_client.upload_file(
-                f"{base_path}/model{get_model_extension(model_type)}",
-                tmp.name,
-            )
-            Path(tmp.name).unlink()
-
-        # Save preprocessing artifacts
-        gcs_client.upload_json(
-            f"{base_path}/preprocess.json",
-            preprocess_artifacts,
-        )
-
-        # Save postprocessing config
-        gcs_client.upload_json(
-            f"{base_path}/postprocess.json",
-            postprocess_config,
-        )
-
-        # Save metrics
-        gcs_client.upload_json(
-            f"{base_path}/metrics.json",
-            metrics,
-        )
-
-        # Save model signature (expected input schema)
+        # Model signature (expected input schema)
         signature = {
             "feature_columns": feature_columns,
             "task_type": task_type,
             "model_type": model_type,
         }
-        gcs_client.upload_json(
-            f"{base_path}/signature.json",
-            signature,
-        )
+
+        # Bundle the four small JSON artifacts into one object so the save
+        # costs two requests (binary + bundle) instead of five
+        bundle = {
+            "preprocess": preprocess_artifacts,
+            "postprocess": postprocess_config,
+            "metrics": metrics,
+            "signature": signature,
+        }
+
+        # Each upload is a blocking HTTPS round trip; run both concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    _save_model_to_gcs,
+                    trainer,
+                    model,
+                    f"{base_path}/model{ext}",
+                    model_type,
+                    gcs_client,
+                ),
+                executor.submit(gcs_client.upload_json, f"{base_path}/bundle.json", bundle),
+            ]
+            # Surface the first failure (and wait for the rest)
+            for future in futures:
+                future.result()
 
         logger.info(
             "save_model_artifacts_completed",
@@ -98,6 +115,48 @@ def save_model_artifacts(
         raise ExternalServiceError("GCS", f"Failed to save model artifacts: {str(e)}")
 
 
+def _download_artifact_bundle(base_path: str, gcs_client: GCSClient) -> Tuple[Dict, Dict, Dict]:
+    """Fetch the bundled JSON artifacts, falling back to per-file objects.
+
+    Models saved before bundling wrote preprocess/postprocess/signature as
+    individual files.
+    """
+    try:
+        bundle = gcs_client.download_json(f"{base_path}/bundle.json")
+        return bundle["preprocess"], bundle["postprocess"], bundle["signature"]
+    except ExternalServiceError:
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            preprocess_future = executor.submit(
+                gcs_client.download_json, f"{base_path}/preprocess.json"
+            )
+            postprocess_future = executor.submit(
+                gcs_client.download_json, f"{base_path}/postprocess.json"
+            )
+            signature_future = executor.submit(
+                gcs_client.download_json, f"{base_path}/signature.json"
+            )
+            return (
+                preprocess_future.result(),
+                postprocess_future.result(),
+                signature_future.result(),
+            )
+
+
+# In-process LRU of loaded models keyed by (artifact_uri, model_type,
+# task_type). A prediction server asks for the same model on nearly every
+# request; without this, each call re-downloads and re-deserializes the
+# booster. An explicit dict (not lru_cache) because trainer and gcs_client
+# aren't hashable.
+_MODEL_CACHE_MAX = 32
+_model_cache: OrderedDict = OrderedDict()
+
+
+def invalidate_model_cache(artifact_uri: str) -> None:
+    """Evict cached models for an artifact URI (call after deletion)."""
+    for key in [k for k in _model_cache if k[0] == artifact_uri]:
+        del _model_cache[key]
+
+
 def load_model_artifacts(
     artifact_uri: str,
     trainer: Any,
@@ -106,7 +165,7 @@ def load_model_artifacts(
     gcs_client: GCSClient,
 ) -> Tuple[Any, Dict, Dict, Dict]:
     """
-    Load complete model artifacts from GCS.
+    Load complete model artifacts from GCS (cached per process).
 
     Returns:
         - model: Loaded model
@@ -114,33 +173,45 @@ def load_model_artifacts(
         - postprocess_config: Postprocessing config
         - signature: Model signature
     """
+    cache_key = (artifact_uri, model_type, task_type)
+    cached = _model_cache.get(cache_key)
+    if cached is not None:
+        _model_cache.move_to_end(cache_key)
+        logger.info("load_model_artifacts_cache_hit", artifact_uri=artifact_uri)
+        return cached
+
     logger.info("load_model_artifacts_started", artifact_uri=artifact_uri)
 
     try:
         # Extract base path from URI
         base_path = artifact_uri.replace(f"gs://{gcs_client.bucket_name}/", "")
 
-        # Load model binary
-        model_path = f"{base_path}/model{get_model_extension(model_type)}"
-        with tempfile.NamedTemporaryFile(
-            suffix=get_model_extension(model_type), delete=False
-        ) as tmp:
-            gcs_client.download_to_file(model_path, tmp.name)
-            model = trainer.load_model(tmp.name, task_type)
-            Path(tmp.name).unlink()
+        ext = get_model_extension(model_type)
+        model_path = f"{base_path}/model{ext}"
 
-        # Load preprocessing artifacts
-        preprocess_artifacts = gcs_client.download_json(f"{base_path}/preprocess.json")
+        # Both reads pay their own HTTP round trip; issue them concurrently
+        # so cold-start load latency is ~1x RTT. The tempfile lives on tmpfs
+        # when available: the download write and load_model's reread then
+        # stay entirely in RAM instead of round-tripping through disk.
+        with tempfile.NamedTemporaryFile(suffix=ext, dir=_TMPFS_DIR, delete=False) as tmp:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                binary_future = executor.submit(gcs_client.download_to_file, model_path, tmp.name)
+                bundle_future = executor.submit(_download_artifact_bundle, base_path, gcs_client)
 
-        # Load postprocessing config
-        postprocess_config = gcs_client.download_json(f"{base_path}/postprocess.json")
+                binary_future.result()
+                preprocess_artifacts, postprocess_config, signature = bundle_future.result()
 
-        # Load signature
-        signature = gcs_client.download_json(f"{base_path}/signature.json")
+            # Deserialize on the calling thread once the binary is on disk
+            model = trainer.load_model(tmp.name, task_type)
+            Path(tmp.name).unlink()
 
         logger.info("load_model_artifacts_completed", artifact_uri=artifact_uri)
 
-        return model, preprocess_artifacts, postprocess_config, signature
+        result = (model, preprocess_artifacts, postprocess_config, signature)
+        _model_cache[cache_key] = result
+        if len(_model_cache) > _MODEL_CACHE_MAX:
+            _model_cache.popitem(last=False)
+        return result
 
     except Exception as e:
         logger.error("load_model_artifacts_failed", artifact_uri=artifact_uri, error=str(e))
@@ -170,17 +241,16 @@ def save_trial_artifacts(
 
     try:
         base_path = f"experiments/{experiment_id}/trials/{trial_number}"
+        ext = get_model_extension(model_type)
 
         # Save model binary
-        with tempfile.NamedTemporaryFile(
-            suffix=get_model_extension(model_type), delete=False
-        ) as tmp:
-            trainer.save_model(model, tmp.name)
-            gcs_client.upload_file(
-                f"{base_path}/model{get_model_extension(model_type)}",
-                tmp.name,
-            )
-            Path(tmp.name).unlink()
+        _save_model_to_gcs(
+            trainer,
+            model,
+            f"{base_path}/model{ext}",
+            model_type,
+            gcs_client,
+        )
 
         # Save trial metadata
         metadata = {
@@ -229,9 +299,11 @@ def delete_model_artifacts(artifact_uri: str, gcs_client: GCSClient) -> None:
         # List all blobs with this prefix
         blobs = gcs_client.list_blobs(base_path)
 
-        # Delete each blob
-        for blob_path in blobs:
-            gcs_client.delete(blob_path)
+        # One batched request per 100 blobs instead of a round trip each
+        if blobs:
+            gcs_client.delete_many(blobs)
+
+        invalidate_model_cache(artifact_uri)
 
         logger.info(
             "delete_model_artifacts_completed",
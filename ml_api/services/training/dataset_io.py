@@ -1,9 +1,9 @@
 """Dataset I/O operations using Polars (primary) with explicit pandas conversion when needed."""
 
-from typing import Tuple
-import tempfile
-from pathlib import Path
+import io
+from typing import Optional, Tuple
 
+import numpy as np
 import polars as pl
 import pandas as pd
 
@@ -14,25 +14,42 @@ from ml_api.clients import GCSClient
 logger = get_logger(__name__)
 
 
-def load_dataset_from_uri(uri: str, gcs_client: GCSClient) -> pl.DataFrame:
-    """Load dataset from URI (GCS or local) using Polars."""
-    logger.info("load_dataset_started", uri=uri)
+def load_dataset_from_uri(
+    uri: str,
+    gcs_client: GCSClient,
+    columns: Optional[list[str]] = None,
+    filters: Optional[pl.Expr] = None,
+) -> pl.DataFrame:
+    """Load dataset from URI (GCS or local) using Polars.
+
+    Pass `columns`/`filters` to push projection and predicates into the
+    reader: parquet is columnar, so unused columns are never decoded and
+    filtered row groups are skipped.
+    """
+    logger.info("load_dataset_started", uri=uri, columns=columns)
 
     try:
         if uri.startswith("gs://"):
-            # Download from GCS to temp file
+            # Download into memory and parse the buffer directly; the old
+            # tempfile roundtrip wrote every byte to disk only to re-read it
             blob_path = uri.replace(f"gs://{gcs_client.bucket_name}/", "")
-
-            with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-                gcs_client.download_to_file(blob_path, tmp.name)
-                df = pl.read_parquet(tmp.name)
-                Path(tmp.name).unlink()
+            df = pl.read_parquet(io.BytesIO(gcs_client.download_bytes(blob_path)), columns=columns)
+            if filters is not None:
+                df = df.filter(filters)
         else:
             # Local file
             if uri.endswith(".parquet"):
-                df = pl.read_parquet(uri)
+                # Lazy scan so projection and predicate reach the row groups
+                lf = pl.scan_parquet(uri)
+                if columns is not None:
+                    lf = lf.select(columns)
+                if filters is not None:
+                    lf = lf.filter(filters)
+                df = lf.collect()
             elif uri.endswith(".csv"):
-                df = pl.read_csv(uri)
+                df = pl.read_csv(uri, columns=columns)
+                if filters is not None:
+                    df = df.filter(filters)
             else:
                 raise DataProcessingError(f"Unsupported file format: {uri}")
 
@@ -45,12 +62,16 @@ def load_dataset_from_uri(uri: str, gcs_client: GCSClient) -> pl.DataFrame:
         raise DataProcessingError(f"Failed to load dataset from {uri}: {str(e)}")
 
 
-def load_dataset_from_records(records: list[dict]) -> pl.DataFrame:
-    """Load dataset from inline records using Polars."""
+def load_dataset_from_records(records: list[dict], schema: Optional[dict] = None) -> pl.DataFrame:
+    """Load dataset from inline records using Polars.
+
+    Pass `schema` ({column: dtype}, e.g. derived from the model signature)
+    to skip per-request schema inference over the row dicts.
+    """
     logger.info("load_dataset_from_records_started", num_records=len(records))
 
     try:
-        df = pl.DataFrame(records)
+        df = pl.from_dicts(records, schema=schema)
         log_dataframe_info(logger, "loaded_from_records", df)
         logger.info("load_dataset_from_records_completed", rows=df.shape[0], cols=df.shape[1])
         return df
@@ -69,13 +90,11 @@ def save_dataset_to_gcs(
     logger.info("save_dataset_started", blob_path=blob_path, rows=df.shape[0], cols=df.shape[1])
 
     try:
-        # Write to temp file then upload
-        with tempfile.NamedTemporaryFile(suffix=".parquet", delete=False) as tmp:
-            df.write_parquet(tmp.name)
-            uri = gcs_client.upload_file(
-                blob_path, tmp.name, content_type="application/octet-stream"
-            )
-            Path(tmp.name).unlink()
+        # Stream parquet into a resumable upload as Polars produces it; the
+        # whole file never sits in memory (or on disk) at once
+        with gcs_client.open_write(blob_path) as sink:
+            df.write_parquet(sink)
+        uri = f"gs://{gcs_client.bucket_name}/{blob_path}"
 
         logger.info("save_dataset_completed", uri=uri)
         return uri
@@ -127,16 +146,17 @@ def _split_random(
     if abs(total_ratio - 1.0) > 0.001:
         raise DataProcessingError(f"Split ratios must sum to 1.0, got {total_ratio}")
 
-    # Shuffle and split
-    df_shuffled = df.sample(fraction=1.0, shuffle=True, seed=seed)
-
-    n = len(df_shuffled)
+    # Gather each partition straight from a permutation of row indices;
+    # sample(shuffle=True) materialized a fully permuted copy of the whole
+    # frame just to slice three contiguous ranges off it
+    n = len(df)
     train_end = int(n * train_ratio)
     val_end = train_end + int(n * val_ratio)
 
-    train_df = df_shuffled[:train_end]
-    val_df = df_shuffled[train_end:val_end]
-    test_df = df_shuffled[val_end:]
+    perm = np.random.default_rng(seed).permutation(n)
+    train_df = df[perm[:train_end]]
+    val_df = df[perm[train_end:val_end]]
+    test_df = df[perm[val_end:]]
 
     logger.info(
         "random_split_completed",
@@ -162,16 +182,24 @@ def _split_time_based(
     train_ratio = params.get("train_ratio", 0.7)
     val_ratio = params.get("val_ratio", 0.15)
 
-    # Sort by time
-    df_sorted = df.sort(time_column)
-
-    n = len(df_sorted)
+    n = len(df)
     train_end = int(n * train_ratio)
     val_end = train_end + int(n * val_ratio)
 
-    train_df = df_sorted[:train_end]
-    val_df = df_sorted[train_end:val_end]
-    test_df = df_sorted[val_end:]
+    # Sort once, then let collect_all run the three boundary filters as one
+    # fused pass over the shared sorted frame instead of three row-copies
+    idx = pl.col("__idx")
+    lf = df.lazy().sort(time_column).with_row_index("__idx")
+    train_df, val_df, test_df = (
+        part.drop("__idx")
+        for part in pl.collect_all(
+            [
+                lf.filter(idx < train_end),
+                lf.filter((idx >= train_end) & (idx < val_end)),
+                lf.filter(idx >= val_end),
+            ]
+        )
+    )
 
     logger.info(
         "time_based_split_completed",
@@ -198,24 +226,34 @@ def _split_entity_based(
     val_ratio = params.get("val_ratio", 0.15)
     seed = params.get("seed", 42)
 
-    # Get unique entities and shuffle them
-    unique_entities = df.select(pl.col(entity_column).unique()).to_series()
-    entities_df = pl.DataFrame({entity_column: unique_entities})
-    entities_shuffled = entities_df.sample(fraction=1.0, shuffle=True, seed=seed)
+    # unique + shuffle in one Polars expression; shuffling in numpy paid an
+    # extra Series materialization and a Python-land copy
+    entities = df.select(pl.col(entity_column).unique().shuffle(seed=seed)).to_series()
 
     # Split entities
-    n_entities = len(entities_shuffled)
+    n_entities = len(entities)
     train_end = int(n_entities * train_ratio)
     val_end = train_end + int(n_entities * val_ratio)
 
-    train_entities = entities_shuffled[:train_end]
-    val_entities = entities_shuffled[train_end:val_end]
-    test_entities = entities_shuffled[val_end:]
-
-    # Filter original data by entity sets
-    train_df = df.join(train_entities, on=entity_column, how="inner")
-    val_df = df.join(val_entities, on=entity_column, how="inner")
-    test_df = df.join(test_entities, on=entity_column, how="inner")
+    # Tag every row with its partition via one entity->tag lookup, then
+    # partition_by splits the frame in a single pass; three is_in filters
+    # scanned the full frame (and re-hashed an entity set) per partition
+    tags = np.full(n_entities, 2, dtype=np.int8)
+    tags[:train_end] = 0
+    tags[train_end:val_end] = 1
+
+    parts = df.with_columns(
+        pl.col(entity_column)
+        .replace(entities, pl.Series(tags), return_dtype=pl.Int8)
+        .alias("__part")
+    ).partition_by("__part", as_dict=True, include_key=False)
+    # partition_by key types differ across Polars versions (scalar vs tuple)
+    parts = {key[0] if isinstance(key, tuple) else key: frame for key, frame in parts.items()}
+
+    empty = df.clear()
+    train_df = parts.get(0, empty)
+    val_df = parts.get(1, empty)
+    test_df = parts.get(2, empty)
 
     logger.info(
         "entity_based_split_completed",
@@ -235,8 +273,9 @@ def polars_to_pandas(df: pl.DataFrame, reason: str) -> pd.DataFrame:
     """
     memory_before = df.estimated_size() / (1024 * 1024)
 
-    # Convert to pandas
-    pdf = df.to_pandas()
+    # Arrow-backed pandas: numeric columns share the Arrow buffers zero-copy
+    # and strings stay in Arrow instead of exploding into PyObject boxes
+    pdf = df.to_pandas(use_pyarrow_extension_array=True)
 
     memory_after = pdf.memory_usage(deep=True).sum() / (1024 * 1024)
 
@@ -1,5 +1,6 @@
 """Training dispatcher with match/case for task_type and model_type."""
 
+from functools import lru_cache
 from typing import Any, Tuple, Protocol
 
 from ml_api.core.logging import get_logger
@@ -8,6 +9,10 @@ from ml_api.db.models.experiment import TaskType, ModelType
 
 logger = get_logger(__name__)
 
+# Trainers are stateless dispatch targets; one instance per model type serves
+# every trial instead of re-importing and re-constructing per call
+_trainer_cache: dict[str, "ModelTrainer"] = {}
+
 
 class ModelTrainer(Protocol):
     """Protocol for model trainers."""
@@ -47,6 +52,12 @@ def get_trainer(model_type: str, task_type: str) -> "ModelTrainer":
 
     Uses match/case for explicit dispatching.
     """
+    _validate_task_type(task_type)
+
+    trainer = _trainer_cache.get(model_type)
+    if trainer is not None:
+        return trainer
+
     logger.info("dispatching_trainer", model_type=model_type, task_type=task_type)
 
     match model_type:
@@ -70,17 +81,26 @@ def get_trainer(model_type: str, task_type: str) -> "ModelTrainer":
                 f"Unsupported model type: {model_type}", {"model_type": model_type}
             )
 
-    # Validate task type
+    _trainer_cache[model_type] = trainer
+    logger.info("trainer_dispatched", trainer=type(trainer).__name__)
+    return trainer
+
+
+# Pure functions over a tiny enum domain, re-run once per Optuna trial;
+# lru_cache turns the match chains into a dict hit after first use
+
+
+@lru_cache(maxsize=8)
+def _validate_task_type(task_type: str) -> None:
+    """Reject unknown task types (cached per value)."""
     match task_type:
         case TaskType.CLASSIFICATION | TaskType.REGRESSION:
             pass
         case _:
             raise ValidationError(f"Unsupported task type: {task_type}", {"task_type": task_type})
 
-    logger.info("trainer_dispatched", trainer=type(trainer).__name__)
-    return trainer
-
 
+@lru_cache(maxsize=8)
 def get_default_metric(task_type: str) -> str:
     """Get default metric based on task type (match/case)."""
     match task_type:
@@ -39,57 +39,75 @@ def preprocess_features(
         if missing_cols:
             raise DataProcessingError(f"Missing columns: {missing_cols}")
 
-        # Extract features and target
-        X = df.select(feature_columns)
-        y = df.select(target_column).to_series()
-
-        log_dataframe_info(logger, "X_before_preprocessing", X)
+        # Build the selection + missing-value handling as one lazy plan so
+        # Polars fuses projection and filter/fill into a single parallel pass
+        schema = df.schema
+        lf = df.lazy().select(feature_columns + [target_column])
 
         # Handle missing values
         missing_strategy = config.get("missing_strategy", "drop")
         if missing_strategy == "drop":
-            null_count_before = X.null_count().sum(axis=1)[0]
-            if null_count_before > 0:
-                logger.info("dropping_rows_with_nulls", null_count=null_count_before)
-                # Get mask where any feature is null
-                null_mask = X.select(pl.any_horizontal(pl.all().is_null())).to_series()
-                X = X.filter(~null_mask)
-                y = y.filter(~null_mask)
+            # Drop rows where any feature is null (target rows follow along
+            # since features and target travel in the same frame)
+            lf = lf.filter(~pl.any_horizontal(pl.col(feature_columns).is_null()))
 
         elif missing_strategy == "fill_mean":
-            for col in X.columns:
-                if X[col].dtype in [pl.Float64, pl.Float32, pl.Int64, pl.Int32]:
-                    mean_val = X[col].mean()
-                    X = X.with_columns(pl.col(col).fill_null(mean_val))
-
-        # Encode categorical features
+            # One batched with_columns: Polars computes the means and fills
+            # all numeric columns in a single fused pass
+            fill_exprs = [
+                pl.col(col).fill_null(pl.col(col).mean())
+                for col in feature_columns
+                if schema[col].is_numeric()
+            ]
+            if fill_exprs:
+                lf = lf.with_columns(fill_exprs)
+
+        # Single materialization of the fused plan
+        out = lf.collect()
+        X = out.select(feature_columns)
+        y = out.to_series(len(feature_columns))
+
+        if missing_strategy == "drop" and len(out) < len(df):
+            logger.info("dropped_rows_with_nulls", dropped_rows=len(df) - len(out))
+
+        log_dataframe_info(logger, "X_before_encoding", X)
+
+        # Encode categorical features (single schema scan instead of a
+        # column lookup per iteration)
         categorical_cols = [
-            col for col in X.columns if X[col].dtype == pl.Utf8 or X[col].dtype == pl.Categorical
+            col for col, dtype in X.schema.items() if dtype in (pl.Utf8, pl.Categorical)
         ]
 
         if categorical_cols:
             logger.info("encoding_categoricals", cols=categorical_cols)
-            category_maps = {}
 
-            for col in categorical_cols:
-                # Create category mapping
-                unique_vals = X[col].unique().drop_nulls().to_list()
-                category_map = {val: idx for idx, val in enumerate(sorted(unique_vals))}
-                category_maps[col] = category_map
-
-                # Apply mapping
-                X = X.with_columns(pl.col(col).map_dict(category_map, default=-1).alias(col))
+            # Gather sorted uniques for every categorical column in one pass
+            unique_rows = X.select(
+                [pl.col(col).drop_nulls().unique().sort().implode() for col in categorical_cols]
+            ).row(0)
+            category_maps = {
+                col: {val: idx for idx, val in enumerate(vals)}
+                for col, vals in zip(categorical_cols, unique_rows)
+            }
+
+            # Apply all mappings in one with_columns batch so Polars encodes
+            # the columns in parallel instead of one materialized pass each
+            X = X.with_columns(
+                [
+                    pl.col(col).replace_strict(category_maps[col], default=-1).alias(col)
+                    for col in categorical_cols
+                ]
+            )
 
             artifacts["category_maps"] = category_maps
 
-        # Cast to appropriate types
-        for col in X.columns:
-            if X[col].dtype == pl.Utf8:
-                # Remaining string columns -> cast to int if possible
-                try:
-                    X = X.with_columns(pl.col(col).cast(pl.Float64))
-                except Exception:
-                    logger.warning("could_not_cast_to_numeric", col=col)
+        # Remaining string columns -> cast to numeric if possible (per-column
+        # try/except so one unparseable column doesn't block the others)
+        for col in [col for col, dtype in X.schema.items() if dtype == pl.Utf8]:
+            try:
+                X = X.with_columns(pl.col(col).cast(pl.Float64))
+            except Exception:
+                logger.warning("could_not_cast_to_numeric", col=col)
 
         log_dataframe_info(logger, "X_after_preprocessing", X)
         logger.info("preprocess_completed", rows=len(X), cols=len(X.columns))
@@ -112,19 +130,22 @@ def apply_preprocessing(
     try:
         X = df.select(feature_columns)
 
-        # Apply category mappings
+        # Apply all saved category mappings in one batched pass
         category_maps = artifacts.get("category_maps", {})
-        for col, category_map in category_maps.items():
-            if col in X.columns:
-                X = X.with_columns(pl.col(col).map_dict(category_map, default=-1).alias(col))
-
-        # Cast types
-        for col in X.columns:
-            if X[col].dtype == pl.Utf8:
-                try:
-                    X = X.with_columns(pl.col(col).cast(pl.Float64))
-                except Exception:
-                    pass
+        encode_exprs = [
+            pl.col(col).replace_strict(category_map, default=-1).alias(col)
+            for col, category_map in category_maps.items()
+            if col in X.columns
+        ]
+        if encode_exprs:
+            X = X.with_columns(encode_exprs)
+
+        # Cast types (single schema scan)
+        for col in [col for col, dtype in X.schema.items() if dtype == pl.Utf8]:
+            try:
+                X = X.with_columns(pl.col(col).cast(pl.Float64))
+            except Exception:
+                pass
 
         logger.info("apply_preprocessing_completed", rows=len(X), cols=len(X.columns))
         return X
@@ -10,12 +10,27 @@ os.environ.setdefault("GOOGLE_APPLICATION_CREDENTIALS", "/tmp/fake-gcp-creds.jso
 os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
 os.environ.setdefault("ENVIRONMENT", "development")
 
-# Create fake GCP credentials file
-import json
-
-fake_creds = {
-    "type": "service_account",
-    "project_id": "test-project",
-}
-with open("/tmp/fake-gcp-creds.json", "w") as f:
-    json.dump(fake_creds, f)
+import pytest
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Session-scoped test client: app startup runs once for the whole run."""
+    from fastapi.testclient import TestClient
+
+    from ml_api.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Create fake GCP credentials file (skip the write on warm runs)
+if not os.path.exists("/tmp/fake-gcp-creds.json"):
+    import json
+
+    fake_creds = {
+        "type": "service_account",
+        "project_id": "test-project",
+    }
+    with open("/tmp/fake-gcp-creds.json", "w") as f:
+        json.dump(fake_creds, f)
@@ -1,13 +1,7 @@
 """Tests for health check endpoints."""
 
-from fastapi.testclient import TestClient
-from ml_api.main import app
 
-# Create a simple test client without database dependencies
-client = TestClient(app)
-
-
-def test_healthz():
+def test_healthz(client):
     """Test basic health check."""
     response = client.get("/healthz")
     assert response.status_code == 200
@@ -15,7 +9,7 @@ def test_healthz():
     assert response.json()["service"] == "ml-api"
 
 
-def test_app_version():
+def test_app_version(client):
     """Test version endpoint."""
     response = client.get("/version")
     assert response.status_code == 200
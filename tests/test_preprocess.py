@@ -0,0 +1,32 @@
+"""Tests for preprocessing operations."""
+
+import polars as pl
+
+from ml_api.services.training.preprocess import preprocess_features, apply_preprocessing
+
+
+def test_preprocess_encodes_categorical_column():
+    """Categorical features are encoded to sorted-unique integer codes."""
+    df = pl.DataFrame(
+        {
+            "color": ["red", "green", "blue", "red"],
+            "size": [1.0, 2.0, 3.0, 4.0],
+            "target": [0, 1, 0, 1],
+        }
+    )
+
+    X, y, artifacts = preprocess_features(df, ["color", "size"], "target")
+
+    assert artifacts["category_maps"]["color"] == {"blue": 0, "green": 1, "red": 2}
+    assert X["color"].to_list() == [2, 1, 0, 2]
+    assert y.to_list() == [0, 1, 0, 1]
+
+
+def test_apply_preprocessing_maps_unseen_categories_to_default():
+    """Saved category maps re-apply at predict time; unseen values become -1."""
+    artifacts = {"category_maps": {"color": {"blue": 0, "green": 1, "red": 2}}}
+    df = pl.DataFrame({"color": ["green", "purple"], "size": [1.0, 2.0]})
+
+    X = apply_preprocessing(df, ["color", "size"], artifacts)
+
+    assert X["color"].to_list() == [1, -1]